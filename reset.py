@@ -13,14 +13,15 @@ Author: @devchristian1337
 Created: 20/Jan/2025
 """
 
+import errno
+import functools
 import json
 import os
 import shutil
 import uuid
-import logging
 import platform
 import sys
-from datetime import datetime
+import time
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 from rich.console import Console
@@ -32,27 +33,31 @@ from rich.progress import (
     BarColumn,
     TaskProgressColumn,
 )
-from rich.prompt import Confirm, Prompt
 from rich.theme import Theme
-from rich.layout import Layout
 from rich.table import Table
-from rich import print as rprint
-from rich.style import Style
 from rich.text import Text
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the stdlib encoder
+    orjson = None
+
+_IS_WINDOWS = sys.platform == "win32"
+
 # Import platform-specific modules
-if platform.system() == "Windows":
+if _IS_WINDOWS:
+    import ctypes
     import msvcrt
-    import os as win_os
+
+    _getch = msvcrt.getch
 else:
     import tty
     import termios
-    import os as unix_os
 
 
 def set_terminal_title(title: str):
     """Set the terminal title in a cross-platform way."""
-    if platform.system() == "Windows":
+    if _IS_WINDOWS:
         os.system(f"title {title}")
     else:
         # For Unix-like systems (Linux, macOS)
@@ -62,47 +67,45 @@ def set_terminal_title(title: str):
 
 def clear_screen():
     """Clear the terminal screen in a cross-platform way."""
-    if platform.system() == "Windows":
-        win_os.system("cls")
+    if console.legacy_windows:
+        # Old Windows consoles without VT processing ignore ANSI escapes
+        os.system("cls")
     else:
-        unix_os.system("clear")
-
+        sys.stdout.write("\x1b[2J\x1b[H")
+        sys.stdout.flush()
 
-def hex_to_rgb(hex_color: str) -> str:
-    """Convert hex color to RGB format."""
-    hex_color = hex_color.lstrip("#")
-    r = int(hex_color[0:2], 16)
-    g = int(hex_color[2:4], 16)
-    b = int(hex_color[4:6], 16)
-    return f"{r},{g},{b}"
 
+# Brand colors, precomputed from #0A4A43, #158F82 and #21C0AE
+_DARK = "rgb(10,74,67)"  # Darkest shade
+_TEAL = "rgb(21,143,130)"  # Deep teal
+_TURQ = "rgb(33,192,174)"  # Primary turquoise
 
 # Enhanced theme configuration with custom colors
 custom_theme = Theme(
     {
-        "info": f"bold rgb({hex_to_rgb('#0A4A43')})",  # Darkest shade for maximum contrast
-        "warning": f"bold rgb({hex_to_rgb('#158F82')})",  # Deep teal
+        "info": f"bold {_DARK}",  # Darkest shade for maximum contrast
+        "warning": f"bold {_TEAL}",  # Deep teal
         "error": "bold red",  # Keep red for errors (better accessibility)
-        "success": f"bold rgb({hex_to_rgb('#21c0ae')})",  # Primary turquoise
-        "header": f"bold rgb({hex_to_rgb('#0A4A43')})",  # Darkest shade
-        "prompt": f"bold rgb({hex_to_rgb('#158F82')})",  # Deep teal
-        "progress.bar": f"rgb({hex_to_rgb('#21c0ae')})",  # Primary turquoise
-        "progress.percentage": f"rgb({hex_to_rgb('#0A4A43')})",  # Darkest shade
-        "menu.border": f"rgb({hex_to_rgb('#158F82')})",  # Deep teal
-        "menu.title": f"bold rgb({hex_to_rgb('#0A4A43')})",  # Darkest shade
-        "dialog.border": f"rgb({hex_to_rgb('#21c0ae')})",  # Primary turquoise
-        "dialog.title": f"bold rgb({hex_to_rgb('#0A4A43')})",  # Darkest shade
+        "success": f"bold {_TURQ}",  # Primary turquoise
+        "header": f"bold {_DARK}",  # Darkest shade
+        "prompt": f"bold {_TEAL}",  # Deep teal
+        "progress.bar": _TURQ,  # Primary turquoise
+        "progress.percentage": _DARK,  # Darkest shade
+        "menu.border": _TEAL,  # Deep teal
+        "menu.title": f"bold {_DARK}",  # Darkest shade
+        "dialog.border": _TURQ,  # Primary turquoise
+        "dialog.title": f"bold {_DARK}",  # Darkest shade
     }
 )
 
 # Configure rich console with enhanced theme
 console = Console(theme=custom_theme)
 
-# Configure logging with rich handler
-logging.basicConfig(
-    level=logging.INFO, format="%(message)s", handlers=[logging.StreamHandler()]
-)
-logger = logging.getLogger(__name__)
+# Border styles resolved against the theme once instead of on every render
+_BORDER_STYLES = {
+    name: console.get_style(name)
+    for name in ("info", "warning", "error", "success", "menu.border")
+}
 
 
 class WindsurfResetError(Exception):
@@ -111,51 +114,87 @@ class WindsurfResetError(Exception):
     pass
 
 
-def display_header():
-    """Display an enhanced header with version and system information."""
-    message = Text(
-        "This tool will reset your Windsurf device IDs and create a backup of your existing configuration.",
-        justify="center",
-    )
-    console.print(
-        Panel(
-            message,
-            title="🔧 Windsurf Reset Tool v1.0",
-            border_style="menu.border",
-            title_align="center",
-            padding=(1, 2),
-        )
-    )
-
-
-def display_menu() -> str:
+def _panel(message: str, title: str, style: str) -> Panel:
     """
-    Display an interactive menu with available options.
+    Build a centered message panel in the tool's standard layout.
+
+    Args:
+        message: Text to display inside the panel
+        title: Panel title
+        style: Theme style name used for the border
 
     Returns:
-        str: Selected menu option
+        Panel: The renderable panel
     """
-    menu_items = {
-        "1": "Reset Device IDs",
-        "2": "View Current Configuration",
-        "3": "Exit",
-    }
+    return Panel(
+        Text(message, justify="center"),
+        title=title,
+        border_style=_BORDER_STYLES.get(style, style),
+        padding=(1, 2),
+    )
+
+
+# Static panels are built once and re-rendered on every menu iteration
+HEADER_PANEL = Panel(
+    Text(
+        "This tool will reset your Windsurf device IDs and create a backup of your existing configuration.",
+        justify="center",
+    ),
+    title="🔧 Windsurf Reset Tool v1.0",
+    border_style=_BORDER_STYLES["menu.border"],
+    title_align="center",
+    padding=(1, 2),
+)
+GOODBYE_PANEL = _panel(
+    "Thank you for using Windsurf Reset Tool!", "[-] Goodbye", "info"
+)
+NO_BACKUP_PANEL = _panel("Proceeding without backup", "[!] Warning", "warning")
+
+MENU_ITEMS = {
+    "1": "Reset Device IDs",
+    "2": "View Current Configuration",
+    "3": "Exit",
+}
 
+
+def _build_menu_panel() -> Panel:
+    """Build the main menu panel from MENU_ITEMS."""
     menu = Table.grid(padding=2)
     menu.add_column(style="prompt")
     menu.add_column(style="info")
 
-    for key, value in menu_items.items():
+    for key, value in MENU_ITEMS.items():
         menu.add_row(f"[{key}]", value)
 
-    console.print(
-        Panel(menu, title="Main Menu", border_style="menu.border", padding=(1, 2))
+    return Panel(
+        menu,
+        title="Main Menu",
+        border_style=_BORDER_STYLES["menu.border"],
+        padding=(1, 2),
     )
 
+
+MENU_PANEL = _build_menu_panel()
+
+
+def display_header():
+    """Display an enhanced header with version and system information."""
+    console.print(HEADER_PANEL)
+
+
+def display_menu() -> str:
+    """
+    Display an interactive menu with available options.
+
+    Returns:
+        str: Selected menu option
+    """
+    console.print(MENU_PANEL)
+
     console.print("[prompt]Press a key to select an option[/prompt]")
     while True:
         choice = get_single_keypress()
-        if choice in menu_items:
+        if choice in MENU_ITEMS:
             return choice
 
 
@@ -178,6 +217,28 @@ def confirm_action(message: str) -> bool:
             return False
 
 
+def _read_key_windows() -> str:
+    """Read a single key on Windows via msvcrt."""
+    # getch returns one byte; lower it as bytes and map it straight to a str
+    # instead of going through the UTF-8 codec
+    return chr(_getch().lower()[0])
+
+
+def _read_key_unix() -> str:
+    """Read a single key on Unix-like systems by switching stdin to raw mode."""
+    fd = sys.stdin.fileno()
+    old_settings = termios.tcgetattr(fd)
+    try:
+        tty.setraw(fd)
+        ch = sys.stdin.read(1).lower()
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+    return ch
+
+
+_read_key = _read_key_windows if _IS_WINDOWS else _read_key_unix
+
+
 def get_single_keypress() -> str:
     """
     Get a single keypress from the user without requiring Enter.
@@ -186,25 +247,102 @@ def get_single_keypress() -> str:
     Returns:
         str: The character pressed by the user
     """
-    if platform.system() == "Windows":
-        return msvcrt.getch().decode("utf-8").lower()
+    return _read_key()
+
+
+_COPY_CHUNK_SIZE = 1 << 20
+# Errors meaning "this copy method is unavailable here", not a real I/O failure
+_COPY_FALLBACK_ERRNOS = {
+    errno.ENOSYS,
+    errno.EXDEV,
+    errno.EINVAL,
+    errno.ENOTSUP,
+    errno.EOPNOTSUPP,
+    errno.ENOTSOCK,
+}
+
+
+def _copy_fd(src_fd: int, dst_fd: int):
+    """
+    Copy the remaining contents of src_fd into dst_fd.
+
+    Tries copy_file_range (reflink/server-side copy), then sendfile on Linux,
+    then a buffered readinto loop, falling through when the kernel refuses a method.
+    """
+    if hasattr(os, "copy_file_range"):
+        copied = 0
+        try:
+            while True:
+                sent = os.copy_file_range(src_fd, dst_fd, _COPY_CHUNK_SIZE)
+                if not sent:
+                    break
+                copied += sent
+        except OSError as e:
+            if e.errno not in _COPY_FALLBACK_ERRNOS:
+                raise
+        else:
+            # Some kernels/filesystems (cross-fs on 5.3-5.18, FUSE, procfs)
+            # report 0 on the first call despite data; fall through then
+            if copied:
+                return
+
+    # Only Linux sendfile accepts a None offset and a regular file as output;
+    # macOS/BSD require an integer offset and a socket
+    if sys.platform.startswith("linux") and hasattr(os, "sendfile"):
+        try:
+            while os.sendfile(dst_fd, src_fd, None, _COPY_CHUNK_SIZE):
+                pass
+            return
+        except OSError as e:
+            if e.errno not in _COPY_FALLBACK_ERRNOS:
+                raise
+
+    buffer = bytearray(_COPY_CHUNK_SIZE)
+    view = memoryview(buffer)
+    with open(src_fd, "rb", buffering=0, closefd=False) as src:
+        with open(dst_fd, "wb", buffering=0, closefd=False) as dst:
+            while True:
+                read = src.readinto(buffer)
+                if not read:
+                    break
+                written = 0
+                while written < read:
+                    written += dst.write(view[written:read])
+
+
+def _fast_copy(src: str, dst: str):
+    """
+    Copy a file and its metadata using the platform's fastest copy primitive.
+
+    Args:
+        src: Path string of the source file
+        dst: Path string of the destination file
+    """
+    if _IS_WINDOWS:
+        if not ctypes.windll.kernel32.CopyFileW(src, dst, False):
+            raise ctypes.WinError()
     else:
-        fd = sys.stdin.fileno()
-        old_settings = termios.tcgetattr(fd)
+        src_fd = os.open(src, os.O_RDONLY)
         try:
-            tty.setraw(sys.stdin.fileno())
-            ch = sys.stdin.read(1).lower()
+            dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+            try:
+                _copy_fd(src_fd, dst_fd)
+            finally:
+                os.close(dst_fd)
         finally:
-            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-        return ch
+            os.close(src_fd)
+    shutil.copystat(src, dst)
 
 
-def backup_file(file_path: Path) -> Optional[Path]:
+def backup_file(
+    file_path: Path, file_stat: Optional[os.stat_result] = None
+) -> Optional[Path]:
     """
     Create a timestamped backup of the given file with enhanced progress feedback.
 
     Args:
         file_path: Path to the file to backup
+        file_stat: Existing os.stat() result for file_path, to skip re-checking it
 
     Returns:
         Path to the backup file if successful, None if source doesn't exist
@@ -213,10 +351,9 @@ def backup_file(file_path: Path) -> Optional[Path]:
         WindsurfResetError: If backup operation fails
     """
     try:
-        if file_path.exists():
-            backup_path = file_path.with_name(
-                f"{file_path.name}.backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-            )
+        if file_stat is not None or file_path.exists():
+            source_path = os.fspath(file_path)
+            backup_path = f"{source_path}.backup_{time.strftime('%Y%m%d_%H%M%S')}"
             with Progress(
                 SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
@@ -225,28 +362,30 @@ def backup_file(file_path: Path) -> Optional[Path]:
                 console=console,
             ) as progress:
                 task = progress.add_task("Creating backup...", total=100)
-                shutil.copy2(file_path, backup_path)
+                _fast_copy(source_path, backup_path)
                 progress.update(task, advance=100)
 
-            message = Text(f"Backup created at:\n{backup_path}", justify="center")
             console.print(
-                Panel(
-                    message,
-                    title="[+] Backup Complete",
-                    border_style="success",
-                    padding=(1, 2),
+                _panel(
+                    f"Backup created at:\n{backup_path}",
+                    "[+] Backup Complete",
+                    "success",
                 )
             )
-            return backup_path
+            return Path(backup_path)
         return None
     except Exception as e:
         raise WindsurfResetError(f"Failed to create backup: {str(e)}") from e
 
 
+@functools.lru_cache(maxsize=1)
 def get_storage_file() -> Path:
     """
     Determine the storage file location based on the operating system.
 
+    The result is cached for the session; failures are not cached, so a
+    failed lookup is retried on the next call.
+
     Returns:
         Path object pointing to the storage file location
 
@@ -256,30 +395,32 @@ def get_storage_file() -> Path:
     try:
         system = platform.system()
 
+        # "~" is expanded only for the selected entry
         paths = {
-            "Windows": Path(os.getenv("APPDATA", "")),
-            "Darwin": Path.home() / "Library" / "Application Support",
-            "Linux": Path.home() / ".config",
+            "Windows": os.environ.get("APPDATA", ""),
+            "Darwin": "~/Library/Application Support",
+            "Linux": "~/.config",
         }
 
         base_path = paths.get(system)
-        if not base_path:
+        if base_path is None:
             supported_os = ", ".join(paths.keys())
             raise WindsurfResetError(
                 f"Unsupported operating system: {system}. "
                 f"Supported systems are: {supported_os}"
             )
+        base_path = os.path.expanduser(base_path)
 
-        storage_path = (
-            base_path / "Windsurf" / "User" / "globalStorage" / "storage.json"
+        storage_path = os.path.join(
+            base_path, "Windsurf", "User", "globalStorage", "storage.json"
         )
 
-        if not base_path.exists():
+        if not os.path.isdir(base_path):
             raise WindsurfResetError(f"Base directory does not exist: {base_path}")
-        if not os.access(str(base_path), os.W_OK):
+        if not os.access(base_path, os.W_OK):
             raise WindsurfResetError(f"No write permission for directory: {base_path}")
 
-        return storage_path
+        return Path(storage_path)
     except Exception as e:
         if isinstance(e, WindsurfResetError):
             raise
@@ -288,6 +429,127 @@ def get_storage_file() -> Path:
         ) from e
 
 
+def _parse_json(raw: bytes) -> Tuple[dict, bool]:
+    """
+    Parse JSON bytes, using orjson when available.
+
+    Args:
+        raw: JSON document to parse
+
+    Returns:
+        Tuple of the parsed data and whether orjson parsed it. Data only the
+        stdlib accepts (lone surrogates, NaN) must also be written back with
+        the stdlib, since orjson would turn NaN/Infinity into null.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(raw), True
+        except orjson.JSONDecodeError:
+            # orjson is stricter than the stdlib, so only report invalid JSON
+            # once json.loads has rejected it too
+            pass
+    return json.loads(raw), False
+
+
+def _load_json(raw: bytes) -> dict:
+    """Parse JSON bytes, using orjson when available."""
+    return _parse_json(raw)[0]
+
+
+def _dump_json(data: dict, use_orjson: bool = True) -> bytes:
+    """
+    Serialize data to compact UTF-8 JSON bytes, using orjson when available.
+
+    Args:
+        data: Data to serialize
+        use_orjson: False for data that orjson could not parse (see _parse_json)
+
+    Returns:
+        bytes: The encoded document
+    """
+    if orjson is not None and use_orjson:
+        try:
+            return orjson.dumps(data)
+        except TypeError:
+            # e.g. integers wider than 64 bits, which the stdlib encodes fine
+            pass
+    try:
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode(
+            "utf-8"
+        )
+    except UnicodeEncodeError:
+        # Lone surrogates can't be encoded as UTF-8; keep them as \u escapes
+        return json.dumps(data, separators=(",", ":")).encode("ascii")
+
+
+# os.open defaults to text mode on Windows, which would rewrite newlines
+_O_BINARY = getattr(os, "O_BINARY", 0)
+
+
+def _read_file(file_path: Path, size_hint: int = 0) -> bytes:
+    """
+    Read a whole file through a single raw descriptor.
+
+    Args:
+        file_path: Path of the file to read
+        size_hint: Expected size in bytes, e.g. st_size from an earlier stat
+
+    Returns:
+        bytes: The file contents
+    """
+    fd = os.open(file_path, os.O_RDONLY | _O_BINARY)
+    try:
+        chunks = [os.read(fd, size_hint or _COPY_CHUNK_SIZE)]
+        # Keep reading in case the file grew since it was stat'ed
+        while chunks[-1]:
+            chunks.append(os.read(fd, _COPY_CHUNK_SIZE))
+    finally:
+        os.close(fd)
+    return b"".join(chunks)
+
+
+def _atomic_write(file_path: Path, payload: bytes, mode: Optional[int] = None):
+    """
+    Write payload to a temporary sibling file, fsync it and rename it over file_path.
+
+    Args:
+        file_path: Path of the file to replace
+        payload: Complete file contents
+        mode: Permission bits for the new file; defaults to those of file_path
+    """
+    # Replace the symlink target rather than the link itself, so configs
+    # managed through symlinks (e.g. dotfile repos) are updated in place
+    target_path = os.path.realpath(file_path)
+    tmp_path = target_path + ".tmp"
+    if mode is None:
+        try:
+            # Keep the permissions of the file being replaced
+            mode = os.stat(target_path).st_mode & 0o777
+        except FileNotFoundError:
+            mode = 0o600
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY, mode)
+    try:
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view) :]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, target_path)
+    except BaseException:
+        # Don't leave a partial storage.json.tmp behind (e.g. ENOSPC, or
+        # Windows refusing the replace while Windsurf holds the file open)
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+_urandom = os.urandom
+
+
 def generate_device_ids() -> Dict[str, str]:
     """
     Generate new device IDs for Windsurf.
@@ -295,9 +557,11 @@ def generate_device_ids() -> Dict[str, str]:
     Returns:
         Dictionary containing the new device IDs
     """
+    # One RNG call for both 32-byte machine IDs
+    random_bytes = _urandom(64)
     return {
-        "telemetry.machineId": os.urandom(32).hex(),
-        "telemetry.macMachineId": os.urandom(32).hex(),
+        "telemetry.machineId": random_bytes[:32].hex(),
+        "telemetry.macMachineId": random_bytes[32:].hex(),
         "telemetry.devDeviceId": str(uuid.uuid4()),
     }
 
@@ -311,8 +575,8 @@ def display_device_ids(ids: Dict[str, str], title: str = "Device IDs"):
         title: Title for the panel
     """
     table = Table.grid(padding=2)
-    table.add_column(style=f"rgb({hex_to_rgb('#0A4A43')})")  # Darkest shade for labels
-    table.add_column(style=f"rgb({hex_to_rgb('#158F82')})")  # Deep teal for values
+    table.add_column(style=_DARK)  # Darkest shade for labels
+    table.add_column(style=_TEAL)  # Deep teal for values
 
     # Filter out telemetry.sqmId
     filtered_ids = {k: v for k, v in ids.items() if k != "telemetry.sqmId"}
@@ -320,7 +584,9 @@ def display_device_ids(ids: Dict[str, str], title: str = "Device IDs"):
     for key, value in filtered_ids.items():
         table.add_row(f"{key}:", value)
 
-    console.print(Panel(table, title=title, border_style="info", padding=(1, 2)))
+    console.print(
+        Panel(table, title=title, border_style=_BORDER_STYLES["info"], padding=(1, 2))
+    )
 
 
 def reset_windsurf_id() -> bool:
@@ -336,107 +602,70 @@ def reset_windsurf_id() -> bool:
     try:
         storage_file = get_storage_file()
 
-        if storage_file.exists():
+        # Stat once and reuse the result for the backup and load steps
+        try:
+            storage_stat = os.stat(storage_file)
+        except FileNotFoundError:
+            storage_stat = None
+
+        if storage_stat is not None:
             if confirm_action("Would you like to create a backup before proceeding?"):
-                backup_file(storage_file)
+                backup_file(storage_file, storage_stat)
             else:
-                warning_message = Text("Proceeding without backup", justify="center")
-                console.print(
-                    Panel(
-                        warning_message,
-                        title="[!] Warning",
-                        border_style="warning",
-                        padding=(1, 2),
-                    )
-                )
-
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            console=console,
-        ) as progress:
-            # Initialize total steps
-            total_steps = 5
-            current_step = 0
+                console.print(NO_BACKUP_PANEL)
 
+        with console.status("Resetting device IDs..."):
             # Show storage file status
-            task = progress.add_task("🔍 Locating storage file...", total=total_steps)
-            current_step += 1
-            progress.update(task, completed=current_step)
+            console.print("[info]🔍 Locating storage file...[/info]")
 
             # Create directories if needed
-            progress.update(task, description="📁 Creating directories...")
+            console.print("[info]📁 Creating directories...[/info]")
             storage_file.parent.mkdir(parents=True, exist_ok=True)
-            current_step += 1
-            progress.update(task, completed=current_step)
 
             # Load existing data
-            progress.update(task, description="📖 Loading configuration...")
+            console.print("[info]📖 Loading configuration...[/info]")
             data = {}
-            if storage_file.exists():
+            parsed_by_orjson = True
+            if storage_stat is not None:
                 try:
-                    with open(storage_file, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                except json.JSONDecodeError:
-                    warning_message = Text(
-                        "Invalid JSON in storage file, creating new configuration",
-                        justify="center",
+                    data, parsed_by_orjson = _parse_json(
+                        _read_file(storage_file, storage_stat.st_size)
                     )
+                except json.JSONDecodeError:
                     console.print(
-                        Panel(
-                            warning_message,
-                            title="[!] Warning",
-                            border_style="warning",
-                            padding=(1, 2),
+                        _panel(
+                            "Invalid JSON in storage file, creating new configuration",
+                            "[!] Warning",
+                            "warning",
                         )
                     )
-            current_step += 1
-            progress.update(task, completed=current_step)
 
             # Generate and update IDs
-            progress.update(task, description="🔄 Generating new device IDs...")
+            console.print("[info]🔄 Generating new device IDs...[/info]")
             new_ids = generate_device_ids()
             data.update(new_ids)
-            current_step += 1
-            progress.update(task, completed=current_step)
 
             # Save configuration
-            progress.update(task, description="💾 Saving configuration...")
-            with open(storage_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
-            current_step += 1
-            progress.update(task, completed=current_step)
+            console.print("[info]💾 Saving configuration...[/info]")
+            _atomic_write(
+                storage_file,
+                _dump_json(data, parsed_by_orjson),
+                storage_stat.st_mode & 0o777 if storage_stat is not None else None,
+            )
 
         # Show success message
-        success_message = Text(
-            "Device IDs have been successfully reset!", justify="center"
-        )
         console.print(
-            Panel(
-                success_message, title="Success", border_style="success", padding=(1, 2)
-            )
+            _panel("Device IDs have been successfully reset!", "Success", "success")
         )
 
         display_device_ids(new_ids, "New Device IDs")
         return True
 
     except WindsurfResetError as e:
-        error_message = Text(f"Reset failed: {str(e)}", justify="center")
-        console.print(
-            Panel(
-                error_message, title="[x] Error", border_style="error", padding=(1, 2)
-            )
-        )
+        console.print(_panel(f"Reset failed: {str(e)}", "[x] Error", "error"))
         raise
     except Exception as e:
-        error_message = Text(f"Unexpected error: {str(e)}", justify="center")
-        console.print(
-            Panel(
-                error_message, title="[x] Error", border_style="error", padding=(1, 2)
-            )
-        )
+        console.print(_panel(f"Unexpected error: {str(e)}", "[x] Error", "error"))
         raise WindsurfResetError(f"Failed to reset Windsurf IDs: {str(e)}") from e
 
 
@@ -444,31 +673,26 @@ def view_current_config():
     """Display the current configuration if it exists."""
     try:
         storage_file = get_storage_file()
-        if storage_file.exists():
-            with open(storage_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                display_device_ids(
-                    {k: v for k, v in data.items() if k.startswith("telemetry")},
-                    "Current Device IDs",
-                )
+        try:
+            raw = _read_file(storage_file)
+        except FileNotFoundError:
+            raw = None
+        if raw is not None:
+            data = _load_json(raw)
+            display_device_ids(
+                {k: v for k, v in data.items() if k.startswith("telemetry")},
+                "Current Device IDs",
+            )
         else:
-            info_message = Text("No configuration file found", justify="center")
             console.print(
-                Panel(
-                    info_message,
-                    title="[i] Information",
-                    border_style="info",
-                    padding=(1, 2),
-                )
+                _panel("No configuration file found", "[i] Information", "info")
             )
     except Exception as e:
-        error_message = Text(
-            f"Failed to read configuration: {str(e)}", justify="center"
-        )
+        # The menu keeps running after this error, so re-validate the storage
+        # location on the next action in case the environment changed
+        get_storage_file.cache_clear()
         console.print(
-            Panel(
-                error_message, title="[x] Error", border_style="error", padding=(1, 2)
-            )
+            _panel(f"Failed to read configuration: {str(e)}", "[x] Error", "error")
         )
 
 
@@ -486,50 +710,17 @@ if __name__ == "__main__":
             elif choice == "2":
                 view_current_config()
             else:
-                goodbye_message = Text(
-                    "Thank you for using Windsurf Reset Tool!", justify="center"
-                )
-                console.print(
-                    Panel(
-                        goodbye_message,
-                        title="[-] Goodbye",
-                        border_style="info",
-                        padding=(1, 2),
-                    )
-                )
+                console.print(GOODBYE_PANEL)
                 break
 
             if choice != "3":
                 if not confirm_action("Would you like to perform another operation?"):
-                    goodbye_message = Text(
-                        "Thank you for using Windsurf Reset Tool!", justify="center"
-                    )
-                    console.print(
-                        Panel(
-                            goodbye_message,
-                            title="[-] Goodbye",
-                            border_style="info",
-                            padding=(1, 2),
-                        )
-                    )
+                    console.print(GOODBYE_PANEL)
                     break
 
     except WindsurfResetError as e:
-        error_message = Text(f"Error: {str(e)}", justify="center")
-        console.print(
-            Panel(
-                error_message, title="[x] Error", border_style="error", padding=(1, 2)
-            )
-        )
+        console.print(_panel(f"Error: {str(e)}", "[x] Error", "error"))
         exit(1)
     except KeyboardInterrupt:
-        warning_message = Text("Operation cancelled by user", justify="center")
-        console.print(
-            Panel(
-                warning_message,
-                title="[!] Warning",
-                border_style="warning",
-                padding=(1, 2),
-            )
-        )
+        console.print(_panel("Operation cancelled by user", "[!] Warning", "warning"))
         exit(1)
\ No newline at end of file